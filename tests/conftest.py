@@ -2,92 +2,25 @@
 
 import pytest
 from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from app import app
+from tests.helpers import restore_activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared across the session.
+
+    Entering the client as a context manager runs the app's startup and
+    shutdown events exactly once for the whole test run.
+    """
+    with TestClient(app, follow_redirects=False) as c:
+        yield c
 
 
 @pytest.fixture(autouse=True)
 def reset_activities():
     """Reset activities to initial state before each test."""
-    from app import activities
-    
-    # Store original state
-    original_activities = {
-        "Tennis Club": {
-            "description": "Learn tennis skills and participate in matches",
-            "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and games",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "marcus@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore painting, drawing, and visual arts",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Music Academy": {
-            "description": "Learn instruments and music theory",
-            "schedule": "Wednesdays and Fridays, 4:00 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu", "grace@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 14,
-            "participants": ["noah@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["rachel@mergington.edu", "david@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Clear current activities
-    activities.clear()
-    
-    # Restore original state
-    activities.update(original_activities)
-    
-    yield
-    
-    # Reset again after test
-    activities.clear()
-    activities.update(original_activities)
+    # Restore original state; every test gets this reset before it runs,
+    # so nothing needs undoing afterwards
+    restore_activities()
@@ -0,0 +1,21 @@
+"""Helpers for resetting the app's in-memory state between tests."""
+
+from app import activities
+
+# Snapshot of the app's initial activities, taken at import before any test
+# runs. Only participants are mutated by the endpoints, so keep the rest of
+# each activity as a shared template and copy just the participant sets per reset
+_TEMPLATE = {
+    name: (
+        {key: value for key, value in details.items() if key != "participants"},
+        frozenset(details["participants"]),
+    )
+    for name, details in activities.items()
+}
+
+
+def restore_activities():
+    """Replace the app's activities with a fresh copy of the template."""
+    activities.clear()
+    for name, (details, participants) in _TEMPLATE.items():
+        activities[name] = {**details, "participants": set(participants)}
@@ -2,36 +2,56 @@
 
 import pytest
 
+from tests.helpers import restore_activities
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint."""
 
     def test_root_redirect(self, client):
         """Test that root endpoint redirects to static/index.html."""
-        response = client.get("/", follow_redirects=False)
+        response = client.get("/")
         assert response.status_code == 307
         assert "/static/index.html" in response.headers["location"]
 
 
+@pytest.fixture(scope="class")
+def activities_response(client):
+    """Fetch GET /activities once from the initial state for a test class.
+
+    Class-scoped fixtures are set up before the autouse reset, so the state
+    is reset here explicitly before the request.
+    """
+    restore_activities()
+    return client.get("/activities")
+
+
+@pytest.fixture(scope="class")
+def activities_data(activities_response):
+    """Decoded GET /activities body, shared by every test in the class.
+
+    The same dict is handed to each test, so tests must not modify it.
+    """
+    return activities_response.json()
+
+
 class TestGetActivities:
     """Tests for GET /activities endpoint."""
 
-    def test_get_activities_success(self, client):
+    def test_get_activities_success(self, activities_response, activities_data):
         """Test that get_activities returns all activities."""
-        response = client.get("/activities")
-        assert response.status_code == 200
+        assert activities_response.status_code == 200
         
-        data = response.json()
+        data = activities_data
         assert isinstance(data, dict)
         assert "Tennis Club" in data
         assert "Basketball Team" in data
         assert "Art Club" in data
         assert len(data) == 9  # 9 activities total
 
-    def test_activities_have_required_fields(self, client):
+    def test_activities_have_required_fields(self, activities_data):
         """Test that each activity has required fields."""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_data
         
         for activity_name, activity in data.items():
             assert "description" in activity
@@ -40,10 +60,9 @@ class TestGetActivities:
             assert "participants" in activity
             assert isinstance(activity["participants"], list)
 
-    def test_tennis_club_initial_participants(self, client):
+    def test_tennis_club_initial_participants(self, activities_data):
         """Test that Tennis Club has correct initial participants."""
-        response = client.get("/activities")
-        data = response.json()
+        data = activities_data
         
         tennis_club = data["Tennis Club"]
         assert tennis_club["participants"] == ["alex@mergington.edu"]
@@ -56,7 +75,7 @@ class TestSignupForActivity:
     def test_signup_success(self, client):
         """Test successful signup for an activity."""
         response = client.post(
-            "/activities/Tennis Club/signup?email=newstudent@mergington.edu"
+            "/activities/Tennis Club/signup", params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         assert "Signed up newstudent@mergington.edu for Tennis Club" in response.json()["message"]
@@ -65,7 +84,7 @@ class TestSignupForActivity:
         """Test that signup fails for duplicate email."""
         # alex is already signed up for Tennis Club
         response = client.post(
-            "/activities/Tennis Club/signup?email=alex@mergington.edu"
+            "/activities/Tennis Club/signup", params={"email": "alex@mergington.edu"}
         )
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
@@ -73,7 +92,7 @@ class TestSignupForActivity:
     def test_signup_nonexistent_activity(self, client):
         """Test that signup fails for non-existent activity."""
         response = client.post(
-            "/activities/Nonexistent Club/signup?email=newstudent@mergington.edu"
+            "/activities/Nonexistent Club/signup", params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
@@ -83,7 +102,7 @@ class TestSignupForActivity:
         email = "test.student@mergington.edu"
         
         # Sign up
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        client.post("/activities/Chess Club/signup", params={"email": email})
         
         # Verify in activities list
         response = client.get("/activities")
@@ -96,8 +115,8 @@ class TestSignupForActivity:
         email1 = "student1@mergington.edu"
         email2 = "student2@mergington.edu"
         
-        response1 = client.post(f"/activities/Basketball Team/signup?email={email1}")
-        response2 = client.post(f"/activities/Basketball Team/signup?email={email2}")
+        response1 = client.post("/activities/Basketball Team/signup", params={"email": email1})
+        response2 = client.post("/activities/Basketball Team/signup", params={"email": email2})
         
         assert response1.status_code == 200
         assert response2.status_code == 200
@@ -110,6 +129,18 @@ class TestSignupForActivity:
         assert email2 in participants
         assert len(participants) == 4  # 2 original + 2 new
 
+    def test_signup_participants_sorted(self, client):
+        """Test that participants are returned in sorted order, not signup order."""
+        client.post("/activities/Basketball Team/signup", params={"email": "aaron@mergington.edu"})
+
+        response = client.get("/activities")
+        data = response.json()
+        assert data["Basketball Team"]["participants"] == [
+            "aaron@mergington.edu",
+            "james@mergington.edu",
+            "marcus@mergington.edu",
+        ]
+
 
 class TestRemoveParticipant:
     """Tests for DELETE /activities/{activity_name}/participants/{email} endpoint."""
@@ -158,7 +189,7 @@ class TestRemoveParticipant:
         client.delete(f"/activities/Tennis Club/participants/{email}")
         
         # Sign up again - should succeed
-        response = client.post(f"/activities/Tennis Club/signup?email={email}")
+        response = client.post("/activities/Tennis Club/signup", params={"email": email})
         assert response.status_code == 200
         
         # Verify signed up
@@ -181,16 +212,17 @@ class TestIntegration:
         initial_count = len(response.json()[activity]["participants"])
         
         # 2. Sign up
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = client.post(f"/activities/{activity}/signup", params={"email": email})
         assert response.status_code == 200
         
         # 3. Verify signup
         response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
-        assert len(response.json()[activity]["participants"]) == initial_count + 1
+        participants = response.json()[activity]["participants"]
+        assert email in participants
+        assert len(participants) == initial_count + 1
         
         # 4. Try to sign up again - should fail
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = client.post(f"/activities/{activity}/signup", params={"email": email})
         assert response.status_code == 400
         
         # 5. Remove
@@ -199,17 +231,15 @@ class TestIntegration:
         
         # 6. Verify removal
         response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
-        assert len(response.json()[activity]["participants"]) == initial_count
+        participants = response.json()[activity]["participants"]
+        assert email not in participants
+        assert len(participants) == initial_count
 
     def test_email_url_encoding(self, client):
         """Test that email addresses are properly URL encoded."""
-        from urllib.parse import quote
-        
         email = "test+user@mergington.edu"
-        encoded_email = quote(email, safe='')
         
-        response = client.post(f"/activities/Art Club/signup?email={encoded_email}")
+        response = client.post("/activities/Art Club/signup", params={"email": email})
         assert response.status_code == 200
         
         response = client.get("/activities")
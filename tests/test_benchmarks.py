@@ -0,0 +1,16 @@
+"""Benchmarks guarding the per-test fixture and request overhead."""
+
+import pytest
+
+from tests.helpers import restore_activities
+
+
+@pytest.mark.benchmark(group="fixture")
+def test_reset_and_get(benchmark, client):
+    """Benchmark a state reset followed by a single GET /activities."""
+    def reset_and_get():
+        restore_activities()
+        return client.get("/activities").json()
+
+    data = benchmark(reset_and_get)
+    assert len(data) == 9